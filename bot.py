@@ -1,9 +1,20 @@
+import atexit
+import logging
+import logging.handlers
 import os
+import queue
 import re
+import threading
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
 from slack_bolt import App
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 from slack_bolt.adapter.flask import SlackRequestHandler
-from flask import Flask, request
-from database import Database
+from flask import Flask, Response, request
+from database import Database, ScoreBuffer
+
+logger = logging.getLogger(__name__)
 
 # Load environment variables for local development
 try:
@@ -12,58 +23,127 @@ try:
 except ImportError:
     pass  # dotenv not required in production
 
+# Log through a queue: event handlers only enqueue records, a background thread does the stream I/O
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logging.basicConfig(
+    level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+    format="%(levelname)s %(name)s: %(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
+)
+# Bolt and the Slack SDK log every request at INFO/DEBUG; keep only their problems
+logging.getLogger("slack_bolt").setLevel(logging.WARNING)
+logging.getLogger("slack_sdk").setLevel(logging.WARNING)
+
+def listener_workers():
+    """Listener pool size: gunicorn's worker connections under gevent, a few real threads otherwise"""
+    try:
+        from gevent import monkey
+        # Pool threads are greenlets here, so a listener blocked on Slack/Supabase costs almost nothing;
+        # WORKER_CONNECTIONS is the same setting the Procfile passes to --worker-connections
+        if monkey.is_module_patched("threading"):
+            return int(os.environ.get("WORKER_CONNECTIONS", 500))
+    except ImportError:
+        pass
+    return 5  # Bolt's default pool size (python main.py / bot.py)
+
+
+LISTENER_WORKERS = listener_workers()
+
 # Initialize Slack app with Bot Token and Signing Secret
+# Events are ack'd as soon as they arrive (Bolt's default); listeners then run on the pool
 app = App(
     token=os.environ.get("SLACK_BOT_TOKEN"),
-    signing_secret=os.environ.get("SLACK_SIGNING_SECRET")
+    signing_secret=os.environ.get("SLACK_SIGNING_SECRET"),
+    process_before_response=False,
+    listener_executor=ThreadPoolExecutor(max_workers=LISTENER_WORKERS)
 )
+# Let the SDK wait out 429s (honouring Retry-After) instead of failing the call
+app.client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=3))
+# Fail a hung Slack call after 10s instead of the SDK's 30s default, freeing the worker
+app.client.timeout = 10
 
 # Initialize Flask app for HTTP endpoints
 flask_app = Flask(__name__)
 handler = SlackRequestHandler(app)
 
 # Lazy-load database to prevent startup crashes
+# One shared client per worker process; its HTTP connection pool is reused by every listener thread
 _db = None
+_db_lock = threading.Lock()
+# Point changes are written behind the listeners, in batches (created alongside _db)
+_score_buffer = None
 
 def get_db():
     """Get database instance (lazy initialization)"""
-    global _db
+    global _db, _score_buffer
     if _db is None:
-        try:
-            _db = Database()
-        except Exception as e:
-            print(f"⚠️ Database initialization failed: {e}")
-            print("⚠️ Bot will run but won't persist data")
+        with _db_lock:
+            if _db is None:
+                try:
+                    db = Database()
+                    _score_buffer = ScoreBuffer(db)
+                    atexit.register(_score_buffer.flush)
+                    _db = db
+                except Exception as e:
+                    logger.warning("⚠️ Database initialization failed: %s", e)
+                    logger.warning("⚠️ Bot will run but won't persist data")
     return _db
 
 
 # Track recent file shares (channel_id -> {user_id, timestamp, file_id})
 # Used to match files with tags in adjacent messages
-from collections import defaultdict
+from collections import defaultdict, deque
 import time
 
-recent_file_shares = defaultdict(list)  # channel_id -> list of {user_id, ts, file_id}
+recent_file_shares = defaultdict(deque)  # channel_id -> deque of {user_id, ts, file_id}, oldest first
+file_share_expiry = deque()  # (time, channel_id, file_share) across all channels, oldest first
 MAX_TIME_WINDOW = 60  # seconds to look for adjacent messages
+file_shares_lock = threading.Lock()  # guards recent_file_shares and file_share_expiry
+
+# Recently processed spots, to skip redelivered events: a set for O(1) lookups
+# plus a bounded deque that remembers insertion order for eviction
+MAX_PROCESSED_SPOTS = 1000
+processed_spots = set()  # (channel_id, ts)
+processed_spot_order = deque(maxlen=MAX_PROCESSED_SPOTS)
+processed_spots_lock = threading.Lock()
 
-processed_spot_timestamps = {}  # (channel_id, ts) -> time when processed
-SPOT_PROCESSING_TTL = 5  # seconds - keep track of processed timestamps to avoid duplicates
+
+def remember_file_share(channel_id, file_share):
+    """Store a file share so a later message with tags can claim it"""
+    with file_shares_lock:
+        recent_file_shares[channel_id].append(file_share)
+        file_share_expiry.append((file_share["time"], channel_id, file_share))
 
 
 def clean_old_file_shares():
     """Remove file shares older than MAX_TIME_WINDOW"""
     current_time = time.time()
-    for channel_id in list(recent_file_shares.keys()):
-        recent_file_shares[channel_id] = [
-            fs for fs in recent_file_shares[channel_id]
-            if current_time - fs["time"] < MAX_TIME_WINDOW
-        ]
-        if not recent_file_shares[channel_id]:
-            del recent_file_shares[channel_id]
-    
-    # Clean up old processed timestamps
-    for key in list(processed_spot_timestamps.keys()):
-        if current_time - processed_spot_timestamps[key] > SPOT_PROCESSING_TTL:
-            del processed_spot_timestamps[key]
+    # Only expired entries are touched, regardless of how many channels are tracked
+    with file_shares_lock:
+        while file_share_expiry and current_time - file_share_expiry[0][0] >= MAX_TIME_WINDOW:
+            _, channel_id, file_share = file_share_expiry.popleft()
+            shares = recent_file_shares.get(channel_id)
+            # Already-matched shares were popped from the channel deque; skip those
+            if shares and shares[0] is file_share:
+                shares.popleft()
+            if not shares:
+                recent_file_shares.pop(channel_id, None)
+
+
+def mark_spot_processed(channel_id, ts):
+    """Record a spot as processed; returns False if it was already processed"""
+    key = (channel_id, ts)
+    with processed_spots_lock:
+        if key in processed_spots:
+            return False
+        if len(processed_spot_order) == MAX_PROCESSED_SPOTS:
+            processed_spots.discard(processed_spot_order[0])
+        processed_spot_order.append(key)
+        processed_spots.add(key)
+        return True
 
 
 def get_adjacent_messages(channel_id, ts, limit=2):
@@ -79,43 +159,38 @@ def get_adjacent_messages(channel_id, ts, limit=2):
         )
         return result.get("messages", [])
     except Exception as e:
-        print(f"Error fetching adjacent messages: {e}")
+        logger.error("Error fetching adjacent messages: %s", e)
         return []
 
 
-def extract_mentions(text):
-    """Extract user mentions from text"""
-    if not text:
-        return []
-    return re.findall(r"<@([A-Z0-9]+)>", text)
+MENTION_RE = re.compile(r"<@([A-Z0-9]+)>", re.ASCII)  # Slack user mention, e.g. <@U012AB3CD>
 
 
-def classify_message(event):
-    """Classify message as file or text"""
-    has_files = "files" in event and len(event["files"]) > 0
-    if has_files:
-        file_types = [f.get("mimetype", "unknown") for f in event["files"]]
-        return "file", file_types
-    return "text", []
+def extract_mentions(text, exclude=None):
+    """Extract unique user mentions from text, in order, skipping the `exclude` user (the spotter)"""
+    # Cheap substring probe first; most messages have no mentions at all
+    if not text or "<@" not in text:
+        return []
+    # A user tagged twice in one message still only counts once
+    return [user_id for user_id in dict.fromkeys(MENTION_RE.findall(text)) if user_id != exclude]
 
 
-def is_spot(event, channel_id=None):
+def is_spot(event, has_file, channel_id=None):
     """
     Check if a message is a 'spot':
     - Must have at least one file (any type)
     - Must tag at least one user (in same message, previous message, or next message)
     """
-    has_file = "files" in event and len(event["files"]) > 0
-    
     if not has_file:
         return False, []
     
-    # Check for user mentions in the current message
+    # Check for user mentions in the current message (tagging yourself doesn't count)
+    sender_id = event.get("user")
     text = event.get("text", "")
-    user_mentions = extract_mentions(text)
+    user_mentions = extract_mentions(text, exclude=sender_id)
     
     if user_mentions:
-        print(f"   ✅ Found mentions in same message: {user_mentions}")
+        logger.debug("   ✅ Found mentions in same message: %s", user_mentions)
         return True, user_mentions
     
     # Check adjacent messages if channel_id is provided
@@ -123,117 +198,103 @@ def is_spot(event, channel_id=None):
         ts = event.get("ts")
         if ts:
             adjacent_msgs = get_adjacent_messages(channel_id, ts)
-            print(f"   Checking {len(adjacent_msgs)} adjacent messages")
+            logger.debug("   Checking %d adjacent messages", len(adjacent_msgs))
             
             for msg in adjacent_msgs:
                 if msg.get("ts") != ts:  # Don't check the same message again
-                    mentions = extract_mentions(msg.get("text", ""))
+                    mentions = extract_mentions(msg.get("text", ""), exclude=sender_id)
                     if mentions:
-                        print(f"   ✅ Found mentions in adjacent message: {mentions}")
+                        logger.debug("   ✅ Found mentions in adjacent message: %s", mentions)
                         return True, mentions
     
-    print(f"   ❌ No mentions found in message or adjacent messages")
+    logger.debug("   ❌ No mentions found in message or adjacent messages")
     return False, []
 
 
-def is_spot_from_file_shared(file_id, channel_id, user_id):
-    """
-    Check if a file_shared event is a spot:
-    - Any file type counts
-    - Must tag at least one user (in same message, previous, or next)
-    """
-    try:
-        print(f"🔍 Checking file {file_id} in channel {channel_id} from user {user_id}")
-        
-        # Get file info
-        file_info = app.client.files_info(file=file_id)
-        file_data = file_info["file"]
-        
-        mimetype = file_data.get("mimetype", "")
-        print(f"   File mimetype: {mimetype}")
-        
-        all_mentions = []
-        
-        # Check the initial comment/caption that came with the file upload
-        initial_comment = file_data.get("initial_comment", {})
-        if initial_comment:
-            comment_text = initial_comment.get("comment", "")
-            print(f"   File caption/comment: {comment_text}")
-            mentions = extract_mentions(comment_text)
-            if mentions:
-                print(f"   ✅ Found mentions in file caption: {mentions}")
-                all_mentions.extend(mentions)
-        
-        # Get the message with the file to check for mentions
-        shares = file_data.get("shares", {})
-        print(f"   Shares data available: public={bool(shares.get('public'))}, private={bool(shares.get('private'))}")
-        
-        # Check both public and private channels
-        ts = None
-        for share_type in ["public", "private"]:
-            type_shares = shares.get(share_type, {})
-            if channel_id in type_shares:
-                share_info = type_shares[channel_id][0]
-                ts = share_info.get("ts")
-                print(f"   Found in {share_type} channel, timestamp: {ts}")
-                break
-        
-        if ts:
-            # Check current message and adjacent messages
-            adjacent_msgs = get_adjacent_messages(channel_id, ts, limit=3)
-            print(f"   Checking {len(adjacent_msgs)} messages (current + adjacent)")
-            
-            for msg in adjacent_msgs:
-                text = msg.get("text", "")
-                mentions = extract_mentions(text)
-                if mentions:
-                    print(f"   ✅ Found mentions in message at {msg.get('ts')}: {mentions}")
-                    all_mentions.extend(mentions)
-            
-            # Remove duplicates
-            all_mentions = list(set(all_mentions))
-            
-            if all_mentions:
-                print(f"   ✅ Total unique mentions found: {all_mentions}")
-                return True, all_mentions
-            else:
-                print(f"   ❌ No mentions found in any adjacent messages")
-                # Store this file share to check against future messages
-                recent_file_shares[channel_id].append({
-                    "user_id": user_id,
-                    "ts": ts,
-                    "file_id": file_id,
-                    "time": time.time()
-                })
-                print(f"   📝 Stored file share for future matching")
-        else:
-            print(f"   ❌ Could not find timestamp in shares data")
-            print(f"   Shares structure: {shares}")
-        
-        return False, []
-    except Exception as e:
-        print(f"❌ Error checking file_shared event: {e}")
-        import traceback
-        traceback.print_exc()
-        return False, []
+# Shared pool for fanning out Slack API calls
+slack_executor = ThreadPoolExecutor(max_workers=8)
+
+# Cache usernames for an hour so renamed users eventually refresh
+username_cache = TTLCache(maxsize=10_000, ttl=3600)  # user_id -> username
+username_cache_lock = threading.Lock()  # TTLCache isn't thread-safe; lookups run on slack_executor
+
+# Whole-workspace name directory from users.list, swapped in wholesale on each refresh
+user_directory = {}  # user_id -> username
+USER_DIRECTORY_REFRESH_INTERVAL = 600  # seconds
+
+
+def username_from_user(user):
+    """Pick a display name from a Slack user object"""
+    # Prefer display_name, fall back to real_name or name
+    return user.get("profile", {}).get("display_name") or user.get("real_name") or user.get("name") or user["id"]
+
+
+def refresh_user_directory():
+    """Reload user_directory from a paginated users.list scan"""
+    global user_directory
+    directory = {}
+    cursor = None
+    while True:
+        result = app.client.users_list(limit=200, cursor=cursor)
+        for member in result["members"]:
+            # Deactivated accounts can't spot or be spotted; users.info still covers stragglers
+            if not member.get("deleted"):
+                directory[member["id"]] = username_from_user(member)
+        cursor = result.get("response_metadata", {}).get("next_cursor")
+        if not cursor:
+            break
+    user_directory = directory
+    logger.info("👥 Loaded %d users into the directory", len(directory))
+
+
+def run_user_directory_refresh():
+    """Keep user_directory fresh for the life of the process"""
+    while True:
+        try:
+            refresh_user_directory()
+        except Exception as e:
+            logger.error("Error refreshing user directory: %s", e)
+        time.sleep(USER_DIRECTORY_REFRESH_INTERVAL)
 
 
 def get_username(user_id):
-    """Fetch username from Slack API"""
+    """Fetch username from the directory, falling back to the Slack API (cached)"""
+    username = user_directory.get(user_id)
+    if username:
+        return username
+    with username_cache_lock:
+        username = username_cache.get(user_id)
+    if username:
+        return username
     try:
         result = app.client.users_info(user=user_id)
-        user = result["user"]
-        # Prefer display_name, fall back to real_name or name
-        return user.get("profile", {}).get("display_name") or user.get("real_name") or user.get("name") or user_id
+        username = username_from_user(result["user"])
+        with username_cache_lock:
+            username_cache[user_id] = username
+        return username
     except Exception as e:
-        print(f"Error fetching username for {user_id}: {e}")
+        logger.error("Error fetching username for %s: %s", user_id, e)
         return None
 
 
+def get_usernames(user_ids):
+    """Resolve many usernames: directory hits inline, only misses go to the Slack API (concurrently)"""
+    names = {user_id: user_directory.get(user_id) for user_id in user_ids}
+    missing = [user_id for user_id, name in names.items() if not name]
+    if missing:
+        names.update(zip(missing, slack_executor.map(get_username, missing)))
+    return [names[user_id] for user_id in user_ids]
+
+
+if os.environ.get("SLACK_BOT_TOKEN"):
+    threading.Thread(target=run_user_directory_refresh, name="user-directory", daemon=True).start()
+
+
 def handle_message_event(event, say):
     """Handle all messages in channels (public or private) the bot is in"""
-    # Ignore bot messages and message changes
-    if event.get("subtype") is not None:
+    # Ignore bot messages and message changes; file uploads arrive as "file_share"
+    # messages with their text and files inline, so no extra API calls are needed
+    if event.get("subtype") not in (None, "file_share"):
         return
     
     sender_id = event.get("user")
@@ -241,35 +302,58 @@ def handle_message_event(event, say):
     if not sender_id:
         return
     
-    # Clean old file shares periodically
+    # Drop expired file shares
     clean_old_file_shares()
     
-    # Classify the message
-    msg_type, file_types = classify_message(event)
-    print(f"📩 Message classified as '{msg_type}' from {sender_id} in channel {channel_id}")
-    if msg_type == "file":
-        print(f"   File types: {', '.join(file_types)}")
+    # Classify the message as "file" or "text" (single pass over the file list)
+    files = event.get("files") or []
+    has_file = bool(files)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("📩 Message classified as '%s' from %s in channel %s", "file" if has_file else "text", sender_id, channel_id)
+        if has_file:
+            logger.debug("   File types: %s", ", ".join(f.get("mimetype", "unknown") for f in files))
+    
+    # Most traffic is plain text, which only matters if it can claim a recent file share
+    if not has_file and not recent_file_shares.get(channel_id):
+        return
     
     # Check if this is a spot (message with file)
-    is_valid_spot, tagged_users = is_spot(event, channel_id)
+    ts = event.get("ts")
+    is_valid_spot, tagged_users = is_spot(event, has_file, channel_id)
     
     if is_valid_spot:
-        process_spot(sender_id, tagged_users, channel_id, event.get("ts"))
+        # Skip if Slack redelivered a message we already processed
+        if not mark_spot_processed(channel_id, ts):
+            logger.debug("   ⏭️ Skipping - already processed spot for this timestamp")
+            return
+        process_spot(sender_id, tagged_users, channel_id, ts)
         return
     
-    # If message has no file but has mentions, check for recent file shares
-    if msg_type == "text":
-        mentions = extract_mentions(event.get("text", ""))
-        if mentions and channel_id in recent_file_shares:
-            print(f"   📝 Message has mentions, checking recent file shares...")
-            # Check if there's a recent file share from the same or different user
-            for file_share in recent_file_shares[channel_id]:
-                file_user = file_share["user_id"]
-                print(f"   🔗 Matching with file from {file_user}")
-                process_spot(file_user, mentions, channel_id, file_share.get("ts"))
-                # Remove the matched file share
-                recent_file_shares[channel_id].remove(file_share)
-                return
+    if has_file:
+        # Store this file share so a follow-up message with tags can claim it
+        remember_file_share(channel_id, {
+            "user_id": sender_id,
+            "ts": ts,
+            "file_id": files[0].get("id"),
+            "time": time.time()
+        })
+        logger.debug("   📝 Stored file share for future matching")
+        return
+    
+    # Message has no file but may have mentions: match the oldest recent file share
+    # (from the same or a different user); the file's uploader is the spotter
+    # Peek and claim under one lock so concurrent messages can't claim the same share
+    with file_shares_lock:
+        file_shares = recent_file_shares.get(channel_id)
+        if not file_shares:
+            return
+        file_user = file_shares[0]["user_id"]
+        mentions = extract_mentions(event.get("text", ""), exclude=file_user)
+        if not mentions:
+            return
+        file_share = file_shares.popleft()
+    logger.debug("   🔗 Matching mentions with file from %s", file_user)
+    process_spot(file_user, mentions, channel_id, file_share.get("ts"))
 
 
 @app.event("message")
@@ -278,6 +362,12 @@ def handle_message(event, say):
     handle_message_event(event, say)
 
 
+@app.event("file_shared")
+def handle_file_shared():
+    """Ack file_shared events from apps still subscribed to them; uploads are handled as file_share messages"""
+    # Without a listener Bolt answers 404, and Slack would retry every upload
+
+
 # Note: Slack doesn't have a separate event type for private channel messages.
 # The "message" event covers both public channels and private channels the bot is in.
 # However, if you need to explicitly handle group messages, you can add:
@@ -286,72 +376,50 @@ def handle_message(event, say):
 # regardless of channel type when the bot has the appropriate scopes.
 
 
+def log_reaction_failure(future):
+    """Done-callback for background reactions_add calls"""
+    e = future.exception()
+    if e is not None:
+        logger.warning("⚠️ Failed to add reaction: %s", e)
+
+
 def process_spot(sender_id, tagged_users, channel_id=None, ts=None):
     """Process a valid spot - update points in database"""
     num_tagged = len(tagged_users)
-    sender_username = get_username(sender_id)
     
-    # Update database
-    db = get_db()
-    if db:
-        # Sender gets +1 point per person tagged
-        db.add_points(sender_id, num_tagged, sender_username)
-        
-        # Each tagged user loses 1 point
-        for tagged_user in tagged_users:
-            tagged_username = get_username(tagged_user)
-            db.subtract_points(tagged_user, 1, tagged_username)
+    # Resolve all usernames at once (at most 1 concurrent round-trip instead of N+1)
+    sender_username, *tagged_usernames = get_usernames([sender_id, *tagged_users])
+    
+    # Queue database update: sender gets +1 point per person tagged, each tagged user loses 1 point
+    if get_db():
+        _score_buffer.add_spot(sender_id, sender_username, list(zip(tagged_users, tagged_usernames)))
     
-    # Add reaction to message
+    # Add reaction to message in the background; nothing downstream waits on it
     if channel_id and ts:
-        try:
-            app.client.reactions_add(channel=channel_id, timestamp=ts, name="eyes")
-        except Exception as e:
-            print(f"⚠️ Failed to add reaction: {e}")
+        future = slack_executor.submit(app.client.reactions_add, channel=channel_id, timestamp=ts, name="eyes")
+        future.add_done_callback(log_reaction_failure)
     
-    print(f"✅ Spot processed: {sender_username} ({sender_id}) tagged {num_tagged} users")
+    logger.info("✅ Spot processed: %s (%s) tagged %d users", sender_username, sender_id, num_tagged)
 
 
-@app.event("file_shared")
-def handle_file_shared(event, say):
-    """Handle file_shared events (alternative way Slack sends file messages)"""
-    file_id = event.get("file_id")
-    channel_id = event.get("channel_id")
-    user_id = event.get("user_id")
-    
-    if not file_id or not user_id:
-        return
-    
-    print(f"📎 File shared event detected from {user_id} in channel {channel_id}")
-    
-    # Check if this is a spot
-    is_valid_spot, tagged_users = is_spot_from_file_shared(file_id, channel_id, user_id)
-    
-    if is_valid_spot:
-        # Get the timestamp from file shares
-        shares = app.client.files_info(file=file_id)["file"].get("shares", {})
-        ts = None
-        for share_type in ["public", "private"]:
-            type_shares = shares.get(share_type, {})
-            if channel_id in type_shares:
-                ts = type_shares[channel_id][0].get("ts")
-                break
-        
-        # Skip if we've already processed this timestamp (multiple files in same message)
-        timestamp_key = (channel_id, ts)
-        if timestamp_key in processed_spot_timestamps:
-            print(f"   ⏭️ Skipping - already processed spot for this timestamp")
-            return
-        
-        # Mark this timestamp as processed
-        processed_spot_timestamps[timestamp_key] = time.time()
-        process_spot(user_id, tagged_users, channel_id, ts)
+# Health/root bodies only depend on startup config, so serialize them once
+_HOME_BODY = orjson.dumps({"status": "running", "service": "spotted-bot", "endpoints": ["/health", "/slack/events"]})
+_HEALTH_BODIES = {
+    database_connected: orjson.dumps({
+        "status": "healthy",
+        "service": "spotted-bot",
+        "slack_configured": bool(os.environ.get("SLACK_BOT_TOKEN") and os.environ.get("SLACK_SIGNING_SECRET")),
+        "supabase_configured": bool(os.environ.get("SUPABASE_URL") and os.environ.get("SUPABASE_KEY")),
+        "database_connected": database_connected
+    })
+    for database_connected in (True, False)
+}
 
 
 @flask_app.route("/", methods=["GET"])
 def home():
     """Root endpoint"""
-    return {"status": "running", "service": "spotted-bot", "endpoints": ["/health", "/slack/events"]}, 200
+    return Response(_HOME_BODY, status=200, mimetype="application/json")
 
 
 @flask_app.route("/slack/events", methods=["POST"])
@@ -363,28 +431,14 @@ def slack_events():
 @flask_app.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint for deployment platforms"""
-    status = {
-        "status": "healthy",
-        "service": "spotted-bot",
-        "slack_configured": bool(os.environ.get("SLACK_BOT_TOKEN") and os.environ.get("SLACK_SIGNING_SECRET")),
-        "supabase_configured": bool(os.environ.get("SUPABASE_URL") and os.environ.get("SUPABASE_KEY"))
-    }
-    
-    # Test database connection
-    try:
-        db = get_db()
-        status["database_connected"] = db is not None
-    except Exception as e:
-        status["database_connected"] = False
-        status["database_error"] = str(e)
-    
-    return status, 200
+    # get_db() is cached after the first call and reports failures as None
+    return Response(_HEALTH_BODIES[get_db() is not None], status=200, mimetype="application/json")
 
 
 def start():
     """Start the Flask web server"""
     port = int(os.environ.get("PORT", 3000))
-    print(f"⚡️ Spotted Bot is running on port {port}!")
+    logger.info("⚡️ Spotted Bot is running on port %d!", port)
     flask_app.run(host="0.0.0.0", port=port)
 
 
@@ -1,5 +1,48 @@
+import logging
 import os
-from supabase import create_client, Client
+import queue
+import random
+import threading
+import time
+import httpx
+from postgrest.exceptions import APIError
+from supabase import create_client, Client, ClientOptions
+
+logger = logging.getLogger(__name__)
+
+DB_TIMEOUT = 10  # seconds per PostgREST request (library default is 120)
+
+# HTTP statuses worth retrying; anything else (bad request, auth, missing function) won't fix itself
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# Postgres error classes that are transient: connection, transaction rollback, resources, shutdown
+RETRYABLE_PG_CODE_PREFIXES = ("08", "40", "53", "57P")
+# PostgREST's own connection errors (reported as HTTP 503 with a JSON body)
+RETRYABLE_POSTGREST_CODES = {"PGRST000", "PGRST001", "PGRST002", "PGRST003"}
+# Failures before the request went out: the database never saw it
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def was_rejected(e: Exception) -> bool:
+    """Whether PostgREST answered with a Postgres/PostgREST error (the call was rolled back)"""
+    # Non-JSON bodies (e.g. a gateway 502) carry the HTTP status as an int code instead
+    return isinstance(e, APIError) and isinstance(e.code, str)
+
+
+def is_recoverable_error(e: Exception, idempotent: bool = True) -> bool:
+    """Whether a failed database call may succeed if retried (non-idempotent calls: only if it certainly made no change)"""
+    if isinstance(e, NOT_SENT_ERRORS):
+        return True
+    if was_rejected(e):
+        return e.code in RETRYABLE_POSTGREST_CODES or e.code.startswith(RETRYABLE_PG_CODE_PREFIXES)
+    if not idempotent:
+        # Sent but the outcome is unknown (read timeout, dropped connection, gateway error)
+        return False
+    if isinstance(e, (httpx.TransportError, ConnectionError, TimeoutError)):
+        return True
+    if isinstance(e, APIError):
+        # No code: a gateway error such as a 429 rate limit; int code: HTTP status of a non-JSON body
+        return e.code is None or e.code in RETRYABLE_STATUS_CODES
+    return False
 
 
 class Database:
@@ -11,67 +54,99 @@ class Database:
         if not supabase_url or not supabase_key:
             raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set")
         
-        self.client: Client = create_client(supabase_url, supabase_key)
+        # One client for the process: its PostgREST httpx session keeps connections alive between calls
+        self.client: Client = create_client(supabase_url, supabase_key, options=ClientOptions(postgrest_client_timeout=DB_TIMEOUT))
         self.table_name = "leaderboard"
     
-    def get_user_points(self, user_id: str) -> int:
-        """Get current points for a user"""
-        try:
-            result = self.client.table(self.table_name).select("points").eq("user_id", user_id).execute()
-            
-            if result.data:
-                return result.data[0]["points"]
-            return 0
-        except Exception as e:
-            print(f"Error getting points for {user_id}: {e}")
-            return 0
+    def _retry_operation(self, operation, attempts: int = 3, base_delay: float = 0.5, idempotent: bool = True):
+        """Run operation(), retrying recoverable failures with jittered exponential backoff"""
+        for attempt in range(attempts):
+            try:
+                return operation()
+            except Exception as e:
+                if attempt == attempts - 1 or not is_recoverable_error(e, idempotent):
+                    raise
+                # Jitter keeps concurrent handlers from retrying in lockstep during an outage
+                delay = base_delay * (2 ** attempt) * (1 + random.random() * 0.5)
+                logger.warning("Database call failed (%s), retrying in %.2fs", e, delay)
+                time.sleep(delay)
     
-    def add_points(self, user_id: str, points: int, username: str = None):
-        """Add points to a user (creates user if doesn't exist)"""
-        try:
-            current_points = self.get_user_points(user_id)
-            new_points = current_points + points
-            
-            # Upsert: insert or update
-            data = {
-                "user_id": user_id,
-                "points": new_points
-            }
-            if username:
-                data["username"] = username
-            
-            self.client.table(self.table_name).upsert(data).execute()
-            
-            print(f"Added {points} points to {username or user_id}. New total: {new_points}")
-        except Exception as e:
-            print(f"Error adding points to {user_id}: {e}")
-    
-    def subtract_points(self, user_id: str, points: int, username: str = None):
-        """Subtract points from a user (creates user if doesn't exist)"""
-        try:
-            current_points = self.get_user_points(user_id)
-            new_points = current_points - points
-            
-            # Upsert: insert or update
-            data = {
-                "user_id": user_id,
-                "points": new_points
-            }
-            if username:
-                data["username"] = username
-            
-            self.client.table(self.table_name).upsert(data).execute()
-            
-            print(f"Subtracted {points} points from {username or user_id}. New total: {new_points}")
-        except Exception as e:
-            print(f"Error subtracting points from {user_id}: {e}")
+    def add_points_bulk(self, rows: list):
+        """Apply many (user_id, points, username) changes in one atomic call (creates users if needed)"""
+        changes = [
+            {"user_id": user_id, "points": points, "username": username}
+            for user_id, points, username in rows
+        ]
+        # Single round-trip; the database function upserts every row in one statement,
+        # so a failure leaves no partial update behind. The increment isn't idempotent:
+        # only retry when the call certainly wasn't applied, never after e.g. a read timeout
+        self._retry_operation(self.client.rpc("add_points_bulk", {"changes": changes}).execute, idempotent=False)
     
     def get_leaderboard(self, limit: int = 10):
         """Get top users by points"""
         try:
-            result = self.client.table(self.table_name).select("*").order("points", desc=True).limit(limit).execute()
+            result = self._retry_operation(self.client.table(self.table_name).select("user_id, username, points").order("points", desc=True).limit(limit).execute)
             return result.data
         except Exception as e:
-            print(f"Error getting leaderboard: {e}")
+            logger.error("Error getting leaderboard: %s", e)
             return []
 
+
+class ScoreBuffer:
+    def __init__(self, db: Database, max_batch: int = 20, max_wait: float = 0.5):
+        """Write-behind buffer: queues point changes and writes them in batches from a background thread"""
+        self.db = db
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        # Each item is one spot's list of (user_id, points, username) rows, so a batch can be split per spot
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="score-buffer", daemon=True)
+        self.thread.start()
+    
+    def add_spot(self, sender_id: str, sender_username: str, tagged_users: list):
+        """Queue a spot: sender +1 per tag, each tagged (user_id, username) -1"""
+        rows = [(sender_id, len(tagged_users), sender_username)]
+        rows.extend((user_id, -1, username) for user_id, username in tagged_users)
+        self.queue.put(rows)
+    
+    def flush(self):
+        """Write everything queued so far (call on shutdown)"""
+        while True:
+            spots = self._take(block=False)
+            if not spots:
+                return
+            self._write(spots)
+    
+    def _take(self, block: bool) -> list:
+        """Take up to max_batch queued spots, waiting up to max_wait for the first one if block"""
+        spots = []
+        try:
+            spots.append(self.queue.get(timeout=self.max_wait) if block else self.queue.get_nowait())
+            while len(spots) < self.max_batch:
+                spots.append(self.queue.get_nowait())
+        except queue.Empty:
+            pass
+        return spots
+    
+    def _write(self, spots: list):
+        """Write spots in one call; if the database rejects the batch, write them one by one"""
+        rows = [row for spot in spots for row in spot]
+        try:
+            self.db.add_points_bulk(rows)
+            logger.info("Wrote %d buffered point changes", len(rows))
+        except Exception as e:
+            # A rejected batch was rolled back, so one bad spot shouldn't cost everyone else's points
+            if len(spots) > 1 and was_rejected(e):
+                logger.warning("Batch of %d spots rejected (%s), writing them one by one", len(spots), e)
+                for spot in spots:
+                    self._write([spot])
+                return
+            # Outcome unknown (e.g. read timeout) or still failing: resending could double-apply, so drop
+            logger.error("Error writing %d buffered point changes, dropped %s: %s", len(rows), rows, e)
+    
+    def _run(self):
+        """Background loop: write queued spots as they arrive"""
+        while True:
+            spots = self._take(block=True)
+            if spots:
+                self._write(spots)
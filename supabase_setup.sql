@@ -9,8 +9,9 @@ CREATE TABLE IF NOT EXISTS leaderboard (
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
--- Add an index for faster queries
-CREATE INDEX IF NOT EXISTS idx_leaderboard_points ON leaderboard(points DESC);
+-- Covering index so the leaderboard query is an index-only scan of the top rows
+DROP INDEX IF EXISTS idx_leaderboard_points;
+CREATE INDEX IF NOT EXISTS idx_leaderboard_points_covering ON leaderboard(points DESC) INCLUDE (user_id, username);
 
 -- Optional: Add a trigger to auto-update the updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -21,7 +22,23 @@ BEGIN
 END;
 $$ language 'plpgsql';
 
+-- Drop first so the script can be re-run on an existing install (e.g. to add new functions)
+DROP TRIGGER IF EXISTS update_leaderboard_updated_at ON leaderboard;
 CREATE TRIGGER update_leaderboard_updated_at BEFORE UPDATE
     ON leaderboard FOR EACH ROW
     EXECUTE FUNCTION update_updated_at_column();
 
+-- Apply a batch of point changes (e.g. every change for one spot) in one atomic statement
+-- changes: [{"user_id": "...", "username": "...", "points": 1}, ...]
+CREATE OR REPLACE FUNCTION add_points_bulk(changes JSONB)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO leaderboard (user_id, username, points)
+    SELECT c.user_id, MAX(c.username), SUM(c.points)
+    FROM jsonb_to_recordset(changes) AS c(user_id TEXT, username TEXT, points INTEGER)
+    GROUP BY c.user_id
+    ON CONFLICT (user_id) DO UPDATE
+    SET points = leaderboard.points + EXCLUDED.points,
+        username = COALESCE(EXCLUDED.username, leaderboard.username);
+END;
+$$ language 'plpgsql';